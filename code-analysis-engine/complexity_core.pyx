@@ -0,0 +1,108 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional Cython fast path for the manual complexity fallback.
+
+Build in place with ``python setup_ext.py build_ext --inplace``; the
+analyzer falls back to the pure-Python regex scan when the extension is
+not built. Must stay semantically aligned with _DECISION_RE in
+modules/complexity_analyzer.py: case-insensitive decision keywords on
+identifier boundaries, plus bare '?'.
+"""
+
+cdef inline bint _is_ident(unsigned char c) noexcept:
+    return (
+        (48 <= c <= 57)
+        or (65 <= c <= 90)
+        or (97 <= c <= 122)
+        or c == 95
+    )
+
+
+cdef inline unsigned char _lower(unsigned char c) noexcept:
+    if 65 <= c <= 90:
+        return c + 32
+    return c
+
+
+cdef bint _is_keyword(const unsigned char[:] buf, Py_ssize_t start, Py_ssize_t length) noexcept:
+    # Decision keywords, dispatched on length then first letter.
+    cdef unsigned char c0 = _lower(buf[start])
+    if length == 2:
+        if c0 == b'i':
+            return _lower(buf[start + 1]) == b'f'
+        if c0 == b'o':
+            return _lower(buf[start + 1]) == b'r'
+        return False
+    if length == 3:
+        if c0 == b'f':
+            return _lower(buf[start + 1]) == b'o' and _lower(buf[start + 2]) == b'r'
+        if c0 == b'a':
+            return _lower(buf[start + 1]) == b'n' and _lower(buf[start + 2]) == b'd'
+        if c0 == b't':
+            return _lower(buf[start + 1]) == b'r' and _lower(buf[start + 2]) == b'y'
+        return False
+    if length == 4:
+        if c0 == b'e':
+            return (
+                _lower(buf[start + 1]) == b'l'
+                and (
+                    (_lower(buf[start + 2]) == b'i' and _lower(buf[start + 3]) == b'f')
+                    or (_lower(buf[start + 2]) == b's' and _lower(buf[start + 3]) == b'e')
+                )
+            )
+        if c0 == b'c':
+            return (
+                _lower(buf[start + 1]) == b'a'
+                and _lower(buf[start + 2]) == b's'
+                and _lower(buf[start + 3]) == b'e'
+            )
+        return False
+    if length == 5:
+        if c0 == b'w':
+            return (
+                _lower(buf[start + 1]) == b'h'
+                and _lower(buf[start + 2]) == b'i'
+                and _lower(buf[start + 3]) == b'l'
+                and _lower(buf[start + 4]) == b'e'
+            )
+        return False
+    if length == 6:
+        if c0 == b'e':
+            return (
+                _lower(buf[start + 1]) == b'x'
+                and _lower(buf[start + 2]) == b'c'
+                and _lower(buf[start + 3]) == b'e'
+                and _lower(buf[start + 4]) == b'p'
+                and _lower(buf[start + 5]) == b't'
+            )
+        if c0 == b's':
+            return (
+                _lower(buf[start + 1]) == b'w'
+                and _lower(buf[start + 2]) == b'i'
+                and _lower(buf[start + 3]) == b't'
+                and _lower(buf[start + 4]) == b'c'
+                and _lower(buf[start + 5]) == b'h'
+            )
+        return False
+    return False
+
+
+cpdef int count_decisions(bytes code):
+    """Count decision keywords and '?' in one byte-level scan."""
+    cdef const unsigned char[:] buf = code
+    cdef Py_ssize_t i = 0, n = buf.shape[0], start
+    cdef int count = 0
+    cdef unsigned char c
+    while i < n:
+        c = buf[i]
+        if c == 63:  # '?'
+            count += 1
+            i += 1
+        elif _is_ident(c):
+            start = i
+            while i < n and _is_ident(buf[i]):
+                i += 1
+            if 2 <= i - start <= 6 and _is_keyword(buf, start, i - start):
+                count += 1
+        else:
+            i += 1
+    return count
@@ -1,13 +1,323 @@
-from fastapi import FastAPI
+"""Q-AnalyzerX Code Analysis Engine — FastAPI entry point."""
 
-app = FastAPI()
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from fastapi import FastAPI, HTTPException
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
+
+from models.analysis_result import (
+    ClassicalComplexity,
+    CodeAnalysisResult,
+    LanguageDetectionResult,
+    ProblemType,
+    QuantumComplexity,
+    TimeComplexity,
+)
+from models.unified_ast import SupportedLanguage, UnifiedAST
+from modules.ast_builder import ASTBuilder
+from modules.complexity_analyzer import ComplexityAnalyzer
+from modules.language_detector import LanguageDetector
+from modules.quantum_analyzer import QuantumAnalyzer
+
+app = FastAPI(
+    title="Q-AnalyzerX Code Analysis Engine",
+    description="Hybrid quantum-classical code analyzer",
+    version="0.2.0",
+    default_response_class=ORJSONResponse,
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+language_detector = LanguageDetector()
+ast_builder = ASTBuilder()
+complexity_analyzer = ComplexityAnalyzer()
+quantum_analyzer = QuantumAnalyzer()
+
+# Guardrail for pathological submissions: every scan pass holds the source
+# (and one lowered copy) in memory, so very large inputs double RSS and blow
+# the cache hierarchy before any useful work happens.
+_MAX_CODE_CHARS = 2_000_000
+
+# Identical code is resubmitted constantly (IDE autosave, CI loops), so both
+# detection and full analysis results are memoized on a digest of the source.
+# The analysis cache stores pre-serialized JSON bytes so a hit skips Pydantic
+# revalidation entirely.
+_CACHE_MAX_ENTRIES = 512
+_detection_cache: "OrderedDict[bytes, LanguageDetectionResult]" = OrderedDict()
+_result_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+
+def _cache_key(code: str) -> bytes:
+    return hashlib.blake2b(code.encode(), digest_size=16).digest()
+
+
+def _cache_put(cache: OrderedDict, key: bytes, value) -> None:
+    cache[key] = value
+    if len(cache) > _CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+
+def _detect_cached(code: str, key: Optional[bytes] = None) -> LanguageDetectionResult:
+    if key is None:
+        key = _cache_key(code)
+    cached = _detection_cache.get(key)
+    if cached is not None:
+        _detection_cache.move_to_end(key)
+        return cached
+    detection = language_detector.detect(code)
+    _cache_put(_detection_cache, key, detection)
+    return detection
+
+
+class CodeSubmission(BaseModel):
+    code: str
+    language: Optional[str] = None
+    options: Dict[str, Any] = {}
+
+
+# Zeroed quantum summary fields for the purely classical path, so the
+# constructor call below never re-validates six defaulted floats one by one.
+_CLASSICAL_ZERO_FIELDS = {
+    "qubits_required": 0,
+    "circuit_depth": 0,
+    "gate_count": 0,
+    "cx_gate_ratio": 0.0,
+    "superposition_score": 0.0,
+    "entanglement_score": 0.0,
+}
+
+
+def build_analysis_result(
+    detection: LanguageDetectionResult,
+    unified_ast: UnifiedAST,
+    classical_metrics: ClassicalComplexity,
+    quantum_metrics: Optional[QuantumComplexity],
+    problem_type: ProblemType,
+) -> CodeAnalysisResult:
+    recommendations = []
+    fields = dict(_CLASSICAL_ZERO_FIELDS)
+    if quantum_metrics is not None and quantum_metrics.gate_count > 0:
+        if quantum_metrics.has_entanglement and quantum_metrics.has_superposition:
+            classification = "quantum_advantageous"
+            recommendations.append("Route to QPU or high-fidelity simulator")
+        else:
+            classification = "hybrid"
+            recommendations.append("Candidate for hybrid CPU/QPU execution")
+        if quantum_metrics.qubits_required > 30:
+            recommendations.append(
+                "Circuit exceeds practical state-vector simulation size"
+            )
+        fields.update(
+            qubits_required=quantum_metrics.qubits_required,
+            circuit_depth=quantum_metrics.circuit_depth,
+            gate_count=quantum_metrics.gate_count,
+            cx_gate_ratio=quantum_metrics.cx_gate_ratio,
+            superposition_score=quantum_metrics.superposition_score,
+            entanglement_score=quantum_metrics.entanglement_score,
+        )
+    else:
+        classification = "classical"
+        if classical_metrics.time_complexity in (
+            TimeComplexity.EXPONENTIAL,
+            TimeComplexity.FACTORIAL,
+        ):
+            recommendations.append(
+                "Consider a quantum reformulation for this complexity class"
+            )
+        else:
+            recommendations.append("Route to classical CPU execution")
+    return CodeAnalysisResult(
+        language=detection.language,
+        confidence=detection.confidence,
+        classification=classification,
+        problem_type=problem_type,
+        classical_complexity=classical_metrics,
+        quantum_complexity=quantum_metrics,
+        recommendations=recommendations,
+        **fields,
+    )
 
 
 @app.get("/")
 async def root():
-    return {"message": "Hello World"}
+    return {
+        "service": "Q-AnalyzerX Code Analysis Engine",
+        "version": app.version,
+        "endpoints": ["/analyze", "/detect-language"],
+    }
+
+
+def _validate_submission(code: str) -> None:
+    if not code.strip():
+        raise HTTPException(status_code=400, detail="Empty code submission")
+    if len(code) > _MAX_CODE_CHARS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Submission exceeds {_MAX_CODE_CHARS} characters",
+        )
+
+
+@app.post("/detect-language")
+async def detect_language(submission: CodeSubmission) -> LanguageDetectionResult:
+    _validate_submission(submission.code)
+    return _detect_cached(submission.code)
+
+
+def _analyze_sync(code: str, key: bytes) -> bytes:
+    """CPU-bound analysis pipeline; runs in a worker thread."""
+    detection = _detect_cached(code, key)
+    detected_lang = detection.language
+    if detected_lang == SupportedLanguage.UNKNOWN:
+        raise HTTPException(status_code=400, detail="Could not detect language")
+
+    parser = ast_builder.parser_for(detected_lang)
+    parsed_data = parser.parse(code)
+    unified_ast = ast_builder.build(code, detected_lang, parsed_data=parsed_data)
+
+    classical_metrics = complexity_analyzer.analyze(code, unified_ast.metadata)
+    quantum_metrics = None
+    if parsed_data["gates"] or unified_ast.total_qubits > 0:
+        quantum_metrics = quantum_analyzer.analyze(unified_ast)
+
+    problem_type = complexity_analyzer.determine_problem_type(code, unified_ast)
+    result = build_analysis_result(
+        detection, unified_ast, classical_metrics, quantum_metrics, problem_type
+    )
+    return orjson.dumps(result.model_dump(mode="json"))
+
+
+@app.post("/analyze")
+async def analyze_code(submission: CodeSubmission):
+    _validate_submission(submission.code)
+
+    key = _cache_key(submission.code)
+    cached = _result_cache.get(key)
+    if cached is not None:
+        _result_cache.move_to_end(key)
+        return Response(content=cached, media_type="application/json")
+
+    # Parsing and analysis are pure CPU work; keep them off the event loop
+    # so concurrent requests are not serialized behind one another.
+    payload = await asyncio.to_thread(_analyze_sync, submission.code, key)
+    _cache_put(_result_cache, key, payload)
+    return Response(content=payload, media_type="application/json")
+
+
+# Batch analysis fans out to worker processes so the GIL does not
+# serialize the CPU-bound pipeline; the pool is created on first use and
+# shared across requests to amortize worker warm-up.
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _pool
+
+
+def _reset_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _analyze_batch_worker(code: str, key: bytes) -> Tuple[bool, bytes]:
+    """Pool-worker wrapper around the analysis pipeline.
+
+    Exceptions must not cross the process boundary: HTTPException cannot
+    be unpickled (its __init__ requires status_code), and any raising
+    worker poisons the whole pool. Failures come back as a picklable
+    (ok, payload) pair instead, where the payload is the serialized
+    per-item error object.
+    """
+    try:
+        return True, _analyze_sync(code, key)
+    except HTTPException as exc:
+        return False, orjson.dumps(
+            {"detail": exc.detail, "status_code": exc.status_code}
+        )
+    except Exception as exc:
+        return False, orjson.dumps({"detail": str(exc), "status_code": 500})
+
+
+@app.post("/analyze-batch")
+async def analyze_batch(submissions: List[CodeSubmission]):
+    for submission in submissions:
+        _validate_submission(submission.code)
+
+    loop = asyncio.get_running_loop()
+    pool = _get_pool()
+    payloads: List[Optional[bytes]] = []
+    pending = []
+    for submission in submissions:
+        key = _cache_key(submission.code)
+        cached = _result_cache.get(key)
+        if cached is not None:
+            _result_cache.move_to_end(key)
+            payloads.append(cached)
+        else:
+            payloads.append(None)
+            pending.append(
+                (
+                    len(payloads) - 1,
+                    key,
+                    loop.run_in_executor(
+                        pool, _analyze_batch_worker, submission.code, key
+                    ),
+                )
+            )
+
+    if pending:
+        try:
+            results = await asyncio.gather(*(future for _, _, future in pending))
+        except BrokenProcessPool:
+            # A crashed worker marks the shared pool broken for good;
+            # replace it so the endpoint recovers on the next request.
+            _reset_pool()
+            raise HTTPException(
+                status_code=503,
+                detail="Analysis worker pool crashed; retry the batch",
+            )
+        for (index, key, _), (ok, payload) in zip(pending, results):
+            # Per-item contract: failed items serialize as
+            # {"detail": ..., "status_code": ...} in place of a result and
+            # are never cached.
+            payloads[index] = payload
+            if ok:
+                _cache_put(_result_cache, key, payload)
+
+    body = b"[" + b",".join(payloads) + b"]"
+    return Response(content=body, media_type="application/json")
+
 
+if __name__ == "__main__":
+    import uvicorn
 
-@app.get("/hello/{name}")
-async def say_hello(name: str):
-    return {"message": f"Hello {name}"}
+    # reload is dev-only (set DEV=1); uvloop + httptools come with
+    # uvicorn[standard] and roughly double raw request throughput.
+    dev_mode = os.getenv("DEV") == "1"
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8002,
+        reload=dev_mode,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if dev_mode else os.cpu_count(),
+    )
@@ -0,0 +1,37 @@
+from .unified_ast import (
+    ASTNode,
+    ClassicalRegisterNode,
+    ControlFlowNode,
+    GateType,
+    MeasurementNode,
+    QuantumGateNode,
+    QuantumRegisterNode,
+    SupportedLanguage,
+    UnifiedAST,
+)
+from .analysis_result import (
+    ClassicalComplexity,
+    CodeAnalysisResult,
+    LanguageDetectionResult,
+    ProblemType,
+    QuantumComplexity,
+    TimeComplexity,
+)
+
+__all__ = [
+    "ASTNode",
+    "ClassicalComplexity",
+    "ClassicalRegisterNode",
+    "CodeAnalysisResult",
+    "ControlFlowNode",
+    "GateType",
+    "LanguageDetectionResult",
+    "MeasurementNode",
+    "ProblemType",
+    "QuantumComplexity",
+    "QuantumGateNode",
+    "QuantumRegisterNode",
+    "SupportedLanguage",
+    "TimeComplexity",
+    "UnifiedAST",
+]
@@ -0,0 +1,78 @@
+"""Response models returned by the analysis API."""
+
+from enum import Enum
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from .unified_ast import SupportedLanguage
+
+
+class TimeComplexity(str, Enum):
+    CONSTANT = "O(1)"
+    LOGARITHMIC = "O(log n)"
+    LINEAR = "O(n)"
+    LINEARITHMIC = "O(n log n)"
+    QUADRATIC = "O(n^2)"
+    EXPONENTIAL = "O(2^n)"
+    FACTORIAL = "O(n!)"
+
+
+class ProblemType(str, Enum):
+    SEARCH = "search"
+    OPTIMIZATION = "optimization"
+    FACTORIZATION = "factorization"
+    MACHINE_LEARNING = "machine_learning"
+    FOURIER = "fourier"
+    GENERAL = "general"
+
+
+class LanguageDetectionResult(BaseModel):
+    language: SupportedLanguage
+    confidence: float
+    matched_signatures: List[str] = []
+
+
+class ClassicalComplexity(BaseModel):
+    cyclomatic_complexity: int = 1
+    time_complexity: TimeComplexity = TimeComplexity.CONSTANT
+    space_complexity: str = "O(1)"
+    lines_of_code: int = 0
+    loop_count: int = 0
+    conditional_count: int = 0
+    nesting_depth: int = 0
+    function_count: int = 0
+    has_recursion: bool = False
+
+
+class QuantumComplexity(BaseModel):
+    qubits_required: int = 0
+    circuit_depth: int = 0
+    gate_count: int = 0
+    single_qubit_gate_count: int = 0
+    two_qubit_gate_count: int = 0
+    measurement_count: int = 0
+    cx_gate_ratio: float = 0.0
+    superposition_score: float = 0.0
+    entanglement_score: float = 0.0
+    has_superposition: bool = False
+    has_entanglement: bool = False
+    quantum_volume: float = 0.0
+    estimated_runtime_ms: float = 0.0
+    memory_requirement_mb: float = 0.0
+
+
+class CodeAnalysisResult(BaseModel):
+    language: SupportedLanguage
+    confidence: float
+    classification: str
+    problem_type: ProblemType
+    qubits_required: int = 0
+    circuit_depth: int = 0
+    gate_count: int = 0
+    cx_gate_ratio: float = 0.0
+    superposition_score: float = 0.0
+    entanglement_score: float = 0.0
+    classical_complexity: ClassicalComplexity
+    quantum_complexity: Optional[QuantumComplexity] = None
+    recommendations: List[str] = []
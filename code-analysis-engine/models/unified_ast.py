@@ -0,0 +1,318 @@
+"""Unified intermediate representation shared by all language parsers.
+
+Every parser (Qiskit, Cirq, Q#, OpenQASM, plain Python) normalizes its
+output into these node types so the analyzers never need to know which
+source language the code came from.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+class SupportedLanguage(str, Enum):
+    PYTHON = "python"
+    QISKIT = "qiskit"
+    CIRQ = "cirq"
+    QSHARP = "qsharp"
+    OPENQASM = "openqasm"
+    UNKNOWN = "unknown"
+
+
+class GateType(str, Enum):
+    H = "h"
+    X = "x"
+    Y = "y"
+    Z = "z"
+    S = "s"
+    T = "t"
+    RX = "rx"
+    RY = "ry"
+    RZ = "rz"
+    CNOT = "cnot"
+    CX = "cx"
+    CZ = "cz"
+    SWAP = "swap"
+    CCX = "ccx"
+    TOFFOLI = "toffoli"
+    MEASURE = "measure"
+    BARRIER = "barrier"
+    RESET = "reset"
+    UNKNOWN = "unknown"
+
+
+# Compact integer codes for gate types so the reduction methods below can
+# run as NumPy array operations instead of per-gate Python set lookups.
+GATE_TYPE_CODES = {gate: code for code, gate in enumerate(GateType)}
+
+_ENTANGLING_CODES = np.array(
+    [
+        GATE_TYPE_CODES[g]
+        for g in (
+            GateType.CNOT,
+            GateType.CX,
+            GateType.CZ,
+            GateType.SWAP,
+            GateType.CCX,
+            GateType.TOFFOLI,
+        )
+    ],
+    dtype=np.int8,
+)
+_SINGLE_QUBIT_CODES = np.array(
+    [
+        GATE_TYPE_CODES[g]
+        for g in (
+            GateType.H,
+            GateType.X,
+            GateType.Y,
+            GateType.Z,
+            GateType.S,
+            GateType.T,
+            GateType.RX,
+            GateType.RY,
+            GateType.RZ,
+        )
+    ],
+    dtype=np.int8,
+)
+_SUPERPOSITION_CODES = np.array(
+    [GATE_TYPE_CODES[g] for g in (GateType.H, GateType.RX, GateType.RY)],
+    dtype=np.int8,
+)
+
+
+# Internal node types never cross the HTTP boundary, so they skip Pydantic
+# validation entirely: slotted dataclasses construct far faster and carry no
+# per-instance dict, which matters when a parse emits thousands of gates.
+
+
+@dataclass(slots=True)
+class ASTNode:
+    node_type: str
+    line_number: int = 0
+
+
+@dataclass(slots=True)
+class QuantumGateNode:
+    gate_type: GateType
+    qubits: List[int] = field(default_factory=list)
+    control_qubits: List[int] = field(default_factory=list)
+    parameters: List[float] = field(default_factory=list)
+    is_controlled: bool = False
+    line_number: int = 0
+
+
+@dataclass(slots=True)
+class QuantumRegisterNode:
+    name: str
+    size: int
+    line_number: int = 0
+
+
+@dataclass(slots=True)
+class ClassicalRegisterNode:
+    name: str
+    size: int
+    line_number: int = 0
+
+
+@dataclass(slots=True)
+class MeasurementNode:
+    qubits: List[int] = field(default_factory=list)
+    classical_bits: List[int] = field(default_factory=list)
+    line_number: int = 0
+
+
+@dataclass(slots=True)
+class ControlFlowNode:
+    kind: str
+    line_number: int = 0
+
+
+@dataclass
+class GateArray:
+    """Struct-of-arrays view of a gate list.
+
+    One contiguous array per field instead of one Python object per gate;
+    the node objects stay authoritative, this view exists so analyzer
+    sweeps touch cache-friendly columns.
+    """
+
+    codes: np.ndarray  # int8 gate-type code per gate
+    qubit0: np.ndarray  # int32 first target qubit, -1 if none recorded
+    qubit1: np.ndarray  # int32 second target qubit, -1 if none recorded
+    param0: np.ndarray  # float32 first parameter, 0.0 if none
+    line_number: np.ndarray  # int32 source line
+    is_controlled: np.ndarray  # bool_ per gate
+    # Ragged per-gate qubit lists in CSR layout: gate i's qubits are
+    # qubit_flat[qubit_indptr[i]:qubit_indptr[i + 1]].
+    qubit_indptr: np.ndarray  # int32, length N + 1
+    qubit_flat: np.ndarray  # int32 concatenated qubit indices
+
+    @classmethod
+    def from_gates(cls, gates: List["QuantumGateNode"]) -> "GateArray":
+        n = len(gates)
+        codes = np.empty(n, dtype=np.int8)
+        qubit0 = np.full(n, -1, dtype=np.int32)
+        qubit1 = np.full(n, -1, dtype=np.int32)
+        param0 = np.zeros(n, dtype=np.float32)
+        line_number = np.empty(n, dtype=np.int32)
+        is_controlled = np.zeros(n, dtype=np.bool_)
+        qubit_indptr = np.empty(n + 1, dtype=np.int32)
+        qubit_indptr[0] = 0
+        flat: List[int] = []
+        for i, gate in enumerate(gates):
+            codes[i] = GATE_TYPE_CODES[gate.gate_type]
+            qubits = gate.qubits
+            if qubits:
+                qubit0[i] = qubits[0]
+                if len(qubits) > 1:
+                    qubit1[i] = qubits[1]
+                flat.extend(qubits)
+            qubit_indptr[i + 1] = len(flat)
+            if gate.parameters:
+                param0[i] = gate.parameters[0]
+            line_number[i] = gate.line_number
+            is_controlled[i] = gate.is_controlled
+        qubit_flat = np.array(flat, dtype=np.int32)
+        return cls(
+            codes,
+            qubit0,
+            qubit1,
+            param0,
+            line_number,
+            is_controlled,
+            qubit_indptr,
+            qubit_flat,
+        )
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def qubits_of(self, i: int) -> List[int]:
+        return self.qubit_flat[self.qubit_indptr[i]:self.qubit_indptr[i + 1]].tolist()
+
+    def __getitem__(self, i: int) -> "QuantumGateNode":
+        return QuantumGateNode(
+            gate_type=_CODE_TO_GATE[int(self.codes[i])],
+            qubits=self.qubits_of(i),
+            is_controlled=bool(self.is_controlled[i]),
+            line_number=int(self.line_number[i]),
+        )
+
+
+_CODE_TO_GATE = {code: gate for gate, code in GATE_TYPE_CODES.items()}
+
+
+@njit(cache=True)
+def _asap_depth_csr(qubit_indptr: np.ndarray, qubit_flat: np.ndarray,
+                    n_wires: int) -> int:
+    """ASAP depth over CSR-flattened qubit lists of arbitrary arity.
+
+    Gates with an empty qubit list do not occupy a wire and are ignored,
+    matching the dict-based fallback in QuantumAnalyzer._depth_of.
+    """
+    layers = np.zeros(n_wires, dtype=np.int32)
+    depth = 0
+    for i in range(qubit_indptr.shape[0] - 1):
+        start = qubit_indptr[i]
+        end = qubit_indptr[i + 1]
+        if start == end:
+            continue
+        layer = 0
+        for j in range(start, end):
+            q = qubit_flat[j]
+            if layers[q] > layer:
+                layer = layers[q]
+        layer += 1
+        for j in range(start, end):
+            layers[qubit_flat[j]] = layer
+        if layer > depth:
+            depth = layer
+    return depth
+
+
+@dataclass(frozen=True, slots=True)
+class Metadata:
+    """Source-level counters gathered while building the unified AST."""
+
+    lines_of_code: int = 0
+    loop_count: int = 0
+    conditional_count: int = 0
+    nesting_depth: int = 0
+    function_count: int = 0
+
+
+@dataclass
+class UnifiedAST:
+    """Language-independent view of a parsed source file."""
+
+    language: SupportedLanguage
+    gates: List[QuantumGateNode] = field(default_factory=list)
+    quantum_registers: List[QuantumRegisterNode] = field(default_factory=list)
+    classical_registers: List[ClassicalRegisterNode] = field(default_factory=list)
+    measurements: List[MeasurementNode] = field(default_factory=list)
+    functions: List[Dict[str, Any]] = field(default_factory=list)
+    imports: List[str] = field(default_factory=list)
+    total_qubits: int = 0
+    metadata: Metadata = field(default_factory=Metadata)
+
+    _gate_array: Optional[GateArray] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def gate_array(self) -> GateArray:
+        """Columnar (SoA) view of ``gates``, built once per AST."""
+        array = self._gate_array
+        if array is None or len(array) != len(self.gates):
+            array = GateArray.from_gates(self.gates)
+            self._gate_array = array
+        return array
+
+    @property
+    def gate_type_codes(self) -> np.ndarray:
+        return self.gate_array.codes
+
+    def get_gate_types(self) -> List[GateType]:
+        return [gate.gate_type for gate in self.gates]
+
+    def get_entangling_gates(self) -> List[QuantumGateNode]:
+        mask = np.isin(self.gate_type_codes, _ENTANGLING_CODES)
+        return [self.gates[i] for i in np.nonzero(mask)[0]]
+
+    def get_single_qubit_gates(self) -> List[QuantumGateNode]:
+        mask = np.isin(self.gate_type_codes, _SINGLE_QUBIT_CODES)
+        return [self.gates[i] for i in np.nonzero(mask)[0]]
+
+    def has_superposition(self) -> bool:
+        return bool(np.isin(self.gate_type_codes, _SUPERPOSITION_CODES).any())
+
+    def has_entanglement(self) -> bool:
+        return bool(np.isin(self.gate_type_codes, _ENTANGLING_CODES).any())
+
+    def calculate_circuit_depth(self) -> int:
+        # The CSR columns carry every operand, so three-qubit gates (CCX,
+        # Toffoli) occupy all their wires; the old qubit0/qubit1 kernel
+        # dropped the third wire and disagreed with
+        # QuantumAnalyzer.calculate_circuit_depth.
+        array = self.gate_array
+        if len(array) == 0:
+            return 0
+        n_wires = int(array.qubit_flat.max(initial=-1)) + 1
+        if n_wires == 0:
+            return 0
+        return int(
+            _asap_depth_csr(array.qubit_indptr, array.qubit_flat, n_wires)
+        )
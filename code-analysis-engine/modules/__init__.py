@@ -0,0 +1,11 @@
+from .ast_builder import ASTBuilder
+from .complexity_analyzer import ComplexityAnalyzer
+from .language_detector import LanguageDetector
+from .quantum_analyzer import QuantumAnalyzer
+
+__all__ = [
+    "ASTBuilder",
+    "ComplexityAnalyzer",
+    "LanguageDetector",
+    "QuantumAnalyzer",
+]
@@ -0,0 +1,59 @@
+"""Builds the unified AST from the language-specific parser output."""
+
+from typing import Any, Dict, Optional
+
+from models.unified_ast import Metadata, SupportedLanguage, UnifiedAST
+from parsers import BaseParser, get_parser
+
+
+class ASTBuilder:
+    def parser_for(self, language: SupportedLanguage) -> BaseParser:
+        return get_parser(language)
+
+    def build(
+        self,
+        code: str,
+        language: SupportedLanguage,
+        parsed_data: Optional[Dict[str, Any]] = None,
+    ) -> UnifiedAST:
+        parser = self.parser_for(language)
+        if parsed_data is None:
+            parsed_data = parser.parse(code)
+
+        unified = UnifiedAST(
+            language=language,
+            gates=parsed_data["gates"],
+            quantum_registers=parsed_data["quantum_registers"],
+            classical_registers=parsed_data["classical_registers"],
+            measurements=parsed_data["measurements"],
+            functions=parsed_data["functions"],
+            imports=parsed_data["imports"],
+        )
+        unified.total_qubits = self._count_qubits(unified)
+        unified.metadata = self.get_metadata(code, parser, parsed_data)
+        return unified
+
+    def get_metadata(
+        self, code: str, parser: BaseParser, parsed_data: Dict[str, Any]
+    ) -> Metadata:
+        return Metadata(
+            lines_of_code=parser.count_lines(code),
+            loop_count=parser.count_loops(code),
+            conditional_count=parser.count_conditionals(code),
+            nesting_depth=parser.calculate_nesting_depth(code),
+            function_count=len(parsed_data.get("functions", [])),
+        )
+
+    def _count_qubits(self, unified: UnifiedAST) -> int:
+        if unified.quantum_registers:
+            return sum(reg.size for reg in unified.quantum_registers)
+        max_index = -1
+        for gate in unified.gates:
+            for qubit in gate.qubits:
+                if qubit > max_index:
+                    max_index = qubit
+        for measurement in unified.measurements:
+            for qubit in measurement.qubits:
+                if qubit > max_index:
+                    max_index = qubit
+        return max_index + 1
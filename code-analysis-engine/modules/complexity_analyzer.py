@@ -0,0 +1,351 @@
+"""Classical complexity analysis (cyclomatic complexity, Big-O estimation)."""
+
+import ast
+import re
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Dict, FrozenSet, Optional
+
+from models.analysis_result import ClassicalComplexity, ProblemType, TimeComplexity
+from models.unified_ast import Metadata, UnifiedAST
+
+try:
+    from radon.visitors import ComplexityVisitor
+
+    RADON_AVAILABLE = True
+except ImportError:
+    RADON_AVAILABLE = False
+
+try:
+    # Optional AOT-compiled scanner (see complexity_core.pyx / setup_ext.py).
+    from complexity_core import count_decisions as _count_decisions_c
+except ImportError:
+    _count_decisions_c = None
+
+# One C-level scan over the whole source beats per-line keyword counting.
+_DECISION_RE = re.compile(
+    r"\b(?:if|elif|else|for|while|try|except|and|or|case|switch)\b|\?",
+    re.IGNORECASE,
+)
+
+# Fallback recursion check for source that does not parse as Python.
+# Non-greedy .*? keeps the backreference search from backtracking
+# catastrophically on adversarial input.
+_RECURSION_RE = re.compile(r"def\s+(\w+)\s*\([^)]*\):.*?\1\s*\(", re.DOTALL)
+
+# Keywords consulted by determine_problem_type and estimate_time_complexity.
+# A single Aho-Corasick pass finds all of them at once instead of one
+# substring scan (and one .lower() allocation) per keyword.
+_ANALYSIS_KEYWORDS = (
+    "grover",
+    "oracle",
+    "vqe",
+    "qaoa",
+    "optimizer",
+    "minimize",
+    "shor",
+    "factor",
+    "qnn",
+    "machine",
+    "neural",
+    "train",
+    "qft",
+    "fourier",
+    "factorial",
+    "permut",
+    "fib",
+    "pow",
+    "subset",
+    "sort(",
+    "sorted(",
+    "binary",
+    "bisect",
+    "log",
+)
+
+try:
+    import ahocorasick
+
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _kw in _ANALYSIS_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_kw, _kw)
+    _KEYWORD_AUTOMATON.make_automaton()
+except ImportError:
+    _KEYWORD_AUTOMATON = None
+
+
+# Each analysis keyword owns one bit so a set of matches folds into a
+# single integer and problem-type dispatch becomes mask tests against a
+# priority-ordered table instead of a chain of substring branches.
+_KEYWORD_BIT = {kw: i for i, kw in enumerate(_ANALYSIS_KEYWORDS)}
+
+
+def _mask_of(*keywords: str) -> int:
+    mask = 0
+    for kw in keywords:
+        mask |= 1 << _KEYWORD_BIT[kw]
+    return mask
+
+
+_PROBLEM_DISPATCH = (
+    (_mask_of("grover", "oracle"), ProblemType.SEARCH),
+    (_mask_of("vqe", "qaoa", "optimizer", "minimize"), ProblemType.OPTIMIZATION),
+    (_mask_of("shor", "factor"), ProblemType.FACTORIZATION),
+    (_mask_of("qnn", "machine", "neural", "train"), ProblemType.MACHINE_LEARNING),
+    (_mask_of("qft", "fourier"), ProblemType.FOURIER),
+)
+
+
+# Keyed on a 16-byte content digest like the endpoint and parser caches:
+# an lru_cache keyed on the source itself would pin up to 256 full
+# submissions in memory.
+_KEYWORD_CACHE_MAX = 256
+_keyword_cache: "OrderedDict[bytes, FrozenSet[str]]" = OrderedDict()
+
+
+def _keyword_matches(code: str) -> FrozenSet[str]:
+    """Return the set of analysis keywords present in ``code``."""
+    key = blake2b(code.encode(), digest_size=16).digest()
+    cached = _keyword_cache.get(key)
+    if cached is not None:
+        _keyword_cache.move_to_end(key)
+        return cached
+    code_lower = code.lower()
+    if _KEYWORD_AUTOMATON is not None:
+        matches = frozenset(kw for _, kw in _KEYWORD_AUTOMATON.iter(code_lower))
+    else:
+        matches = frozenset(kw for kw in _ANALYSIS_KEYWORDS if kw in code_lower)
+    _keyword_cache[key] = matches
+    if len(_keyword_cache) > _KEYWORD_CACHE_MAX:
+        _keyword_cache.popitem(last=False)
+    return matches
+
+
+class _RecursionFound(Exception):
+    """Sentinel to abort the recursion walk on the first hit."""
+
+
+class _RecursionVisitor(ast.NodeVisitor):
+    """Detects self-calls in one pass with a stack of enclosing functions."""
+
+    def __init__(self):
+        self._scope = []
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._scope.append(node.name)
+        self.generic_visit(node)
+        self._scope.pop()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if isinstance(node.func, ast.Name) and node.func.id in self._scope:
+            raise _RecursionFound
+        self.generic_visit(node)
+
+
+class _MetricsVisitor(ast.NodeVisitor):
+    """Tallies every AST-derived metric the estimators need in one walk."""
+
+    def __init__(self):
+        self.loop_count = 0
+        self.conditional_count = 0
+        self.function_count = 0
+        self.literal_count = 0
+        self.max_depth = 0
+        self._depth = 0
+
+    def _enter_block(self, node: ast.AST) -> None:
+        self._depth += 1
+        if self._depth > self.max_depth:
+            self.max_depth = self._depth
+        self.generic_visit(node)
+        self._depth -= 1
+
+    def visit_For(self, node: ast.For) -> None:
+        self.loop_count += 1
+        self._enter_block(node)
+
+    def visit_AsyncFor(self, node: ast.AsyncFor) -> None:
+        self.loop_count += 1
+        self._enter_block(node)
+
+    def visit_While(self, node: ast.While) -> None:
+        self.loop_count += 1
+        self._enter_block(node)
+
+    def visit_If(self, node: ast.If) -> None:
+        self.conditional_count += 1
+        self._enter_block(node)
+
+    def visit_Try(self, node: ast.Try) -> None:
+        self._enter_block(node)
+
+    def visit_With(self, node: ast.With) -> None:
+        self._enter_block(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.function_count += 1
+        self._enter_block(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self.function_count += 1
+        self._enter_block(node)
+
+    def visit_List(self, node: ast.List) -> None:
+        self.literal_count += 1
+        self.generic_visit(node)
+
+    def visit_Dict(self, node: ast.Dict) -> None:
+        self.literal_count += 1
+        self.generic_visit(node)
+
+    def visit_Set(self, node: ast.Set) -> None:
+        self.literal_count += 1
+        self.generic_visit(node)
+
+    def visit_ListComp(self, node: ast.ListComp) -> None:
+        self.literal_count += 1
+        self.generic_visit(node)
+
+    def visit_DictComp(self, node: ast.DictComp) -> None:
+        self.literal_count += 1
+        self.generic_visit(node)
+
+
+class ComplexityAnalyzer:
+    def analyze(self, code: str, metadata: Metadata) -> ClassicalComplexity:
+        # Fast path for trivial snippets (REPL one-liners, smoke probes):
+        # no functions, no loops, single statement line - skip radon and
+        # the AST walk entirely.
+        if (
+            len(code) < 256
+            and "\n" not in code.strip()
+            and "def " not in code
+            and metadata.loop_count == 0
+        ):
+            return ClassicalComplexity(
+                cyclomatic_complexity=1,
+                time_complexity=TimeComplexity.CONSTANT,
+                space_complexity="O(1)",
+                lines_of_code=metadata.lines_of_code,
+            )
+        # Parse once; every helper that needs the AST gets this tree instead
+        # of re-invoking the CPython parser.
+        try:
+            tree = ast.parse(code)
+        except SyntaxError:
+            tree = None
+        metrics = None
+        if tree is not None:
+            metrics = _MetricsVisitor()
+            metrics.visit(tree)
+        return ClassicalComplexity(
+            cyclomatic_complexity=self.calculate_cyclomatic_complexity(code, tree),
+            time_complexity=self.estimate_time_complexity(
+                code, metadata, tree, metrics
+            ),
+            space_complexity=self.estimate_space_complexity(code, metrics),
+            lines_of_code=metadata.lines_of_code,
+            loop_count=metadata.loop_count,
+            conditional_count=metadata.conditional_count,
+            nesting_depth=metadata.nesting_depth,
+            function_count=metadata.function_count,
+            has_recursion=self._has_recursion(code, tree),
+        )
+
+    def calculate_cyclomatic_complexity(
+        self, code: str, tree: Optional[ast.AST] = None
+    ) -> int:
+        if RADON_AVAILABLE:
+            if tree is None:
+                try:
+                    tree = ast.parse(code)
+                except SyntaxError:
+                    return self._calculate_complexity_manual(code)
+            try:
+                visitor = ComplexityVisitor.from_ast(tree)
+                return max(
+                    (block.complexity for block in visitor.blocks), default=1
+                )
+            except ValueError:
+                return self._calculate_complexity_manual(code)
+        return self._calculate_complexity_manual(code)
+
+    def _calculate_complexity_manual(self, code: str) -> int:
+        if _count_decisions_c is not None:
+            decisions = _count_decisions_c(code.encode("utf-8", "ignore"))
+        else:
+            decisions = sum(1 for _ in _DECISION_RE.finditer(code))
+        return min(1 + decisions, 50)
+
+    def estimate_time_complexity(
+        self,
+        code: str,
+        metadata: Metadata,
+        tree: Optional[ast.AST] = None,
+        metrics: Optional[_MetricsVisitor] = None,
+    ) -> TimeComplexity:
+        if metrics is not None:
+            loop_count = metrics.loop_count
+            nesting_depth = metrics.max_depth
+        else:
+            loop_count = metadata.loop_count
+            nesting_depth = metadata.nesting_depth
+        matched = _keyword_matches(code)
+
+        if self._has_recursion(code, tree):
+            if "factorial" in matched or "permut" in matched:
+                return TimeComplexity.FACTORIAL
+            if matched & {"fib", "pow", "subset"}:
+                return TimeComplexity.EXPONENTIAL
+            return TimeComplexity.LINEARITHMIC
+        if "sort(" in matched or "sorted(" in matched:
+            return TimeComplexity.LINEARITHMIC
+        if nesting_depth >= 4 or loop_count >= 4:
+            return TimeComplexity.EXPONENTIAL
+        if nesting_depth >= 2 and loop_count >= 2:
+            return TimeComplexity.QUADRATIC
+        if matched & {"binary", "bisect", "log"}:
+            return TimeComplexity.LOGARITHMIC
+        if loop_count >= 1:
+            return TimeComplexity.LINEAR
+        return TimeComplexity.CONSTANT
+
+    def estimate_space_complexity(
+        self, code: str, metrics: Optional[_MetricsVisitor] = None
+    ) -> str:
+        if metrics is not None:
+            if metrics.literal_count >= 1 and metrics.max_depth >= 2:
+                return "O(n^2)"
+            if metrics.literal_count >= 1 or metrics.loop_count >= 1:
+                return "O(n)"
+            return "O(1)"
+        # Non-Python source: fall back to a crude bracket count.
+        structures = code.count("[") + code.count("{")
+        if structures > 20:
+            return "O(n^2)"
+        if structures > 5:
+            return "O(n)"
+        return "O(1)"
+
+    def _has_recursion(self, code: str, tree: Optional[ast.AST] = None) -> bool:
+        if tree is None:
+            try:
+                tree = ast.parse(code)
+            except SyntaxError:
+                return bool(_RECURSION_RE.search(code))
+        try:
+            _RecursionVisitor().visit(tree)
+        except _RecursionFound:
+            return True
+        return False
+
+    def determine_problem_type(self, code: str, unified_ast: UnifiedAST) -> ProblemType:
+        mask = 0
+        for kw in _keyword_matches(code):
+            mask |= 1 << _KEYWORD_BIT[kw]
+        for pattern_mask, problem_type in _PROBLEM_DISPATCH:
+            if mask & pattern_mask:
+                return problem_type
+        return ProblemType.GENERAL
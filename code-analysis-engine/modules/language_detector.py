@@ -0,0 +1,131 @@
+"""Signature-based detection of the submitted source language."""
+
+import ast
+import re
+
+from models.analysis_result import LanguageDetectionResult
+from models.unified_ast import SupportedLanguage
+from modules.regex_backend import Scanner
+
+
+class LanguageDetector:
+    def __init__(self):
+        # Raw pattern sources; compiled once below so detect() never pays
+        # re's per-call cache lookup (or a cache eviction under load).
+        signature_sources = {
+            SupportedLanguage.QISKIT: [
+                r"from\s+qiskit[\w.]*\s+import",
+                r"import\s+qiskit",
+                r"QuantumCircuit\s*\(",
+                r"QuantumRegister\s*\(",
+                r"\.(?:h|x|cx|measure)\(",
+            ],
+            SupportedLanguage.CIRQ: [
+                r"import\s+cirq",
+                r"cirq\.Circuit",
+                r"cirq\.(?:LineQubit|GridQubit)",
+                r"cirq\.[A-Z]\w*\s*\(",
+            ],
+            SupportedLanguage.QSHARP: [
+                r"namespace\s+[\w.]+",
+                r"operation\s+\w+\s*\(",
+                r"open\s+Microsoft\.Quantum",
+                r"(?:using|use)\s*\(?\s*\w+\s*=\s*Qubit",
+            ],
+            SupportedLanguage.OPENQASM: [
+                r"OPENQASM\s+\d",
+                r"qreg\s+\w+\s*\[",
+                r"creg\s+\w+\s*\[",
+                r'include\s+"qelib1\.inc"',
+            ],
+        }
+        # All signatures flattened into one Scanner pass over the source;
+        # _id_map translates the fired pattern ids back to (language,
+        # signature index). The Scanner uses Hyperscan or RE2 when
+        # installed and a fused re alternation otherwise - either way
+        # detection reads the code exactly once. Inner groups in the
+        # sources are non-capturing so the re fallback can attribute
+        # matches by group name.
+        self.pattern_sources = signature_sources
+        self._id_map = [
+            (lang, i)
+            for lang, patterns in signature_sources.items()
+            for i in range(len(patterns))
+        ]
+        self._scanner = Scanner(
+            [
+                pattern
+                for patterns in signature_sources.values()
+                for pattern in patterns
+            ]
+        )
+        # Cheap literal gate: unless one of these substrings occurs no
+        # signature can match, so detect() skips the regex sweep after a
+        # handful of C-level substring scans. Every signature above must
+        # contain at least one of these literals verbatim — the gate-call
+        # signature drops the optional whitespace before '(' so its
+        # literals hold exactly.
+        self.prematchers = (
+            "qiskit",
+            "QuantumCircuit",
+            "QuantumRegister",
+            ".h(",
+            ".x(",
+            ".cx(",
+            ".measure(",
+            "cirq",
+            "namespace",
+            "operation",
+            "Microsoft.Quantum",
+            "Qubit",
+            "OPENQASM",
+            "qreg",
+            "creg",
+            "qelib",
+        )
+        self._python_indicators = [
+            re.compile(pattern, re.MULTILINE)
+            for pattern in (
+                r"def\s+\w+\s*\(",
+                r"^\s*(import|from)\s+\w+",
+                r"print\s*\(",
+                r"if\s+__name__",
+            )
+        ]
+
+    def detect(self, code: str) -> LanguageDetectionResult:
+        matched = {}
+        if any(token in code for token in self.prematchers):
+            for pattern_id in self._scanner.matched_ids(code):
+                lang, idx = self._id_map[pattern_id]
+                matched.setdefault(lang, set()).add(idx)
+
+        if matched:
+            best = max(matched, key=lambda lang: len(matched[lang]))
+            confidence = len(matched[best]) / len(self.pattern_sources[best])
+            return LanguageDetectionResult(
+                language=best,
+                confidence=round(confidence, 3),
+                matched_signatures=[
+                    self.pattern_sources[best][i] for i in sorted(matched[best])
+                ],
+            )
+
+        if self._is_python(code):
+            return LanguageDetectionResult(
+                language=SupportedLanguage.PYTHON, confidence=0.8
+            )
+
+        return LanguageDetectionResult(
+            language=SupportedLanguage.UNKNOWN, confidence=0.0
+        )
+
+    def _is_python(self, code: str) -> bool:
+        for pattern in self._python_indicators:
+            if pattern.search(code):
+                return True
+        try:
+            ast.parse(code)
+            return True
+        except SyntaxError:
+            return False
@@ -0,0 +1,259 @@
+"""Quantum complexity analysis over the unified AST."""
+
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Dict, Tuple
+
+import numpy as np
+
+from models.analysis_result import QuantumComplexity
+from models.unified_ast import (
+    GATE_TYPE_CODES,
+    GateType,
+    UnifiedAST,
+    _asap_depth_csr,
+    _ENTANGLING_CODES,
+    _SINGLE_QUBIT_CODES,
+    _SUPERPOSITION_CODES,
+)
+
+try:
+    # Optional AOT-compiled depth loop (see quantum_analyzer_core.pyx /
+    # setup_ext.py).
+    from quantum_analyzer_core import depth_of as _depth_of_c
+except ImportError:
+    _depth_of_c = None
+
+# Below this many gates the dict-based Python loop wins; above it the
+# flattening cost is dwarfed by moving the layer loop into the compiled
+# CSR kernel.
+_DEPTH_KERNEL_MIN_GATES = 10_000
+
+_H_CODE = GATE_TYPE_CODES[GateType.H]
+_CNOT_CODE = GATE_TYPE_CODES[GateType.CNOT]
+_CX_CODE = GATE_TYPE_CODES[GateType.CX]
+
+# Result-memo capacity. Entries are keyed on a 16-byte circuit digest, so
+# the cache never pins the gate structures themselves.
+_ANALYZE_CACHE_MAX = 128
+
+
+def _r3(x: float) -> float:
+    """Round a non-negative value half-up to 3 decimals.
+
+    Cheaper than round()'s two-argument dispatch in the per-metric hot
+    path; every analyzer metric is >= 0, so half-up is safe.
+    """
+    return int(x * 1000 + 0.5) / 1000.0
+
+
+class QuantumAnalyzer:
+    def __init__(self):
+        self._analyze_cache: "OrderedDict[Tuple[bytes, int, int], QuantumComplexity]" = (
+            OrderedDict()
+        )
+
+    def analyze(self, unified_ast: UnifiedAST) -> QuantumComplexity:
+        # Classical sources dominate real traffic and carry no gates at
+        # all; they short-circuit to a cached constant-time result.
+        if not unified_ast.gates:
+            return self._empty_complexity(
+                unified_ast.total_qubits, len(unified_ast.measurements)
+            )
+        # analyze() is pure in the gate-type codes, qubit groups and
+        # measurement count, so re-analyses of identical code (dashboards,
+        # repeated API calls) hit the memo instead of recounting. The key
+        # is a digest of the circuit structure, not the structure itself —
+        # a 100k-gate circuit would otherwise pin megabytes per entry.
+        qubit_groups = tuple(
+            tuple(gate.qubits) for gate in unified_ast.gates
+        )
+        codes_bytes = unified_ast.gate_type_codes.tobytes()
+        key = (
+            self._circuit_digest(codes_bytes, qubit_groups),
+            unified_ast.total_qubits,
+            len(unified_ast.measurements),
+        )
+        cached = self._analyze_cache.get(key)
+        if cached is not None:
+            self._analyze_cache.move_to_end(key)
+            return cached
+        result = self._analyze(
+            codes_bytes,
+            qubit_groups,
+            unified_ast.total_qubits,
+            len(unified_ast.measurements),
+        )
+        self._analyze_cache[key] = result
+        if len(self._analyze_cache) > _ANALYZE_CACHE_MAX:
+            self._analyze_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _circuit_digest(
+        codes_bytes: bytes, qubit_groups: Tuple[Tuple[int, ...], ...]
+    ) -> bytes:
+        # Codes plus group lengths plus flattened operands pin down the
+        # circuit structure; int32 buffers keep the hashing C-level.
+        digest = blake2b(codes_bytes, digest_size=16)
+        digest.update(
+            np.array([len(q) for q in qubit_groups], dtype=np.int32).tobytes()
+        )
+        digest.update(
+            np.fromiter(
+                (q for qubits in qubit_groups for q in qubits), dtype=np.int32
+            ).tobytes()
+        )
+        return digest.digest()
+
+    @lru_cache(maxsize=64)
+    def _empty_complexity(
+        self, total_qubits: int, measurement_count: int
+    ) -> QuantumComplexity:
+        return QuantumComplexity(
+            qubits_required=total_qubits,
+            circuit_depth=0,
+            gate_count=0,
+            single_qubit_gate_count=0,
+            two_qubit_gate_count=0,
+            measurement_count=measurement_count,
+            cx_gate_ratio=0.0,
+            superposition_score=0.0,
+            entanglement_score=0.0,
+            has_superposition=False,
+            has_entanglement=False,
+            quantum_volume=0.0,
+            estimated_runtime_ms=self.estimate_runtime(0, 0, measurement_count),
+            memory_requirement_mb=self.estimate_memory_requirement(total_qubits),
+        )
+
+    def _analyze(
+        self,
+        codes_bytes: bytes,
+        qubit_groups: Tuple[Tuple[int, ...], ...],
+        total_qubits: int,
+        measurement_count: int,
+    ) -> QuantumComplexity:
+        # One vectorized bincount over the codes column replaces per-gate
+        # Python attribute reads; every metric below is an O(|GateType|)
+        # reduction over the bins.
+        codes = np.frombuffer(codes_bytes, dtype=np.int8)
+        bins = np.bincount(codes, minlength=len(GATE_TYPE_CODES))
+        total_gates = codes.shape[0]
+        # Single guarded divisor shared by every ratio below; the helpers
+        # trust it instead of re-guarding per call.
+        total = total_gates or 1
+        single_count = int(bins[_SINGLE_QUBIT_CODES].sum())
+        entangling_count = int(bins[_ENTANGLING_CODES].sum())
+        superposition_count = int(bins[_SUPERPOSITION_CODES].sum())
+        cx_count = int(bins[_CNOT_CODE]) + int(bins[_CX_CODE])
+        has_h = bool(bins[_H_CODE])
+        depth = self._depth_of(qubit_groups)
+        cx_ratio = cx_count / total
+
+        return QuantumComplexity(
+            qubits_required=total_qubits,
+            circuit_depth=depth,
+            gate_count=total_gates,
+            single_qubit_gate_count=single_count,
+            two_qubit_gate_count=entangling_count,
+            measurement_count=measurement_count,
+            cx_gate_ratio=_r3(cx_ratio),
+            superposition_score=self.calculate_superposition_score(
+                superposition_count, total, has_h
+            ),
+            entanglement_score=self.calculate_entanglement_score(
+                entangling_count, total
+            ),
+            # The bins already answer the presence questions; calling back
+            # into the AST would just rescan the same codes column.
+            has_superposition=superposition_count > 0,
+            has_entanglement=entangling_count > 0,
+            quantum_volume=self.estimate_quantum_volume(total_qubits, depth),
+            estimated_runtime_ms=self.estimate_runtime(
+                single_count, entangling_count, measurement_count
+            ),
+            memory_requirement_mb=self.estimate_memory_requirement(total_qubits),
+        )
+
+    def calculate_circuit_depth(self, unified_ast: UnifiedAST) -> int:
+        return self._depth_of(
+            tuple(tuple(gate.qubits) for gate in unified_ast.gates)
+        )
+
+    @staticmethod
+    def _depth_of(qubit_groups: Tuple[Tuple[int, ...], ...]) -> int:
+        # ASAP layering: each gate lands one layer above the deepest layer
+        # already occupied on any of its wires. O(N) with O(Q) bookkeeping,
+        # and exact where the old gates-per-half-the-qubits heuristic was
+        # only a guess.
+        if len(qubit_groups) >= _DEPTH_KERNEL_MIN_GATES:
+            # Flatten the ragged qubit lists to CSR arrays and run the
+            # compiled kernel; the layer loop itself becomes C-speed.
+            indptr = np.zeros(len(qubit_groups) + 1, dtype=np.int32)
+            np.cumsum([len(q) for q in qubit_groups], out=indptr[1:])
+            flat = np.fromiter(
+                (q for qubits in qubit_groups for q in qubits),
+                dtype=np.int32,
+                count=int(indptr[-1]),
+            )
+            n_wires = int(flat.max(initial=-1)) + 1
+            if n_wires == 0:
+                return 0
+            return int(_asap_depth_csr(indptr, flat, n_wires))
+        if _depth_of_c is not None:
+            # The compiled loop signals -1 for inputs it will not handle
+            # (negative or implausibly large indices); fall through then.
+            depth = _depth_of_c(qubit_groups)
+            if depth >= 0:
+                return depth
+        qubit_layer: Dict[int, int] = {}
+        for qubits in qubit_groups:
+            depth = 1 + max((qubit_layer.get(q, 0) for q in qubits), default=0)
+            for q in qubits:
+                qubit_layer[q] = depth
+        return max(qubit_layer.values(), default=0)
+
+    def calculate_superposition_score(
+        self, superposition_count: int, total_gates: int, has_h: bool
+    ) -> float:
+        # total_gates is pre-guarded (>= 1) by analyze().
+        score = superposition_count / total_gates
+        if has_h:
+            score = min(score + 0.2, 1.0)
+        return _r3(score)
+
+    def calculate_entanglement_score(
+        self, entangling_count: int, total_gates: int
+    ) -> float:
+        # total_gates is pre-guarded (>= 1) by analyze().
+        score = min(entangling_count / total_gates * 2, 1.0)
+        return _r3(score)
+
+    def estimate_quantum_volume(self, qubits: int, depth: int) -> float:
+        effective = min(qubits, depth)
+        if effective <= 0:
+            return 0.0
+        return float(2 ** min(effective, 30))
+
+    def estimate_runtime(
+        self, single_count: int, entangling_count: int, measurement_count: int
+    ) -> float:
+        # Typical superconducting-hardware gate times (ns). Counts come
+        # from analyze(), which already materialized the gate groups once.
+        runtime_ns = (
+            single_count * 35 + entangling_count * 300 + measurement_count * 1000
+        )
+        return _r3(runtime_ns / 1e6)
+
+    def estimate_memory_requirement(self, n_qubits: int) -> float:
+        # State-vector simulation: 16 bytes per complex amplitude, so
+        # 2**n * 16 B / 1 MiB == 2**(n - 16) MiB. A single float pow keeps
+        # large n out of bignum arithmetic, and the exponent is capped the
+        # same way estimate_quantum_volume caps its own: beyond ~1000
+        # qubits the uncapped pow overflows float range, and the estimate
+        # is saturated-astronomical either way.
+        if n_qubits <= 0:
+            return 0.0
+        return _r3(2.0 ** (min(n_qubits, 1024) - 16))
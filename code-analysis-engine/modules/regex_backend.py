@@ -0,0 +1,73 @@
+"""Pluggable multi-pattern scanning backend.
+
+Multi-pattern signature scanning is the workload where a DFA engine
+(Hyperscan, RE2) beats CPython's backtracking ``re``: scan cost stays
+linear in the input length no matter how many alternation branches the
+pattern set has. Both engines are optional dependencies; without them
+the scanner compiles the same pattern set into one fused ``re``
+alternation, which is still a single pass over the source.
+"""
+
+import re
+from typing import List, Set
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - hyperscan is optional
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - google-re2 is optional
+    re2 = None
+
+
+class Scanner:
+    """Matches a fixed pattern list against a source string in one pass.
+
+    Patterns are identified by their position in the list;
+    :meth:`matched_ids` reports which of them occur anywhere in the
+    input. Callers that need capture groups or match positions should
+    keep using ``re`` directly - this class only answers "which
+    signatures fired".
+    """
+
+    def __init__(self, patterns: List[str], flags: int = re.MULTILINE):
+        self.patterns = list(patterns)
+        self._db = None
+        self._combined = None
+        if hyperscan is not None:
+            try:
+                db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+                db.compile(
+                    expressions=[p.encode() for p in self.patterns],
+                    ids=list(range(len(self.patterns))),
+                    flags=[hyperscan.HS_FLAG_MULTILINE] * len(self.patterns),
+                )
+                self._db = db
+            except hyperscan.error:
+                # Hyperscan rejects some PCRE constructs (backreferences,
+                # some lookarounds); fall through to the other backends.
+                self._db = None
+        if self._db is None:
+            engine = re2 if re2 is not None else re
+            source = "|".join(
+                f"(?P<p{i}>{pattern})" for i, pattern in enumerate(self.patterns)
+            )
+            try:
+                self._combined = engine.compile(source, flags)
+            except Exception:
+                # RE2 lacks a few re features as well; re always works.
+                self._combined = re.compile(source, flags)
+
+    def matched_ids(self, code: str) -> Set[int]:
+        """Return the ids of every pattern that occurs in ``code``."""
+        if self._db is not None:
+            found: Set[int] = set()
+
+            def _on_match(pattern_id, start, end, match_flags, context=None):
+                found.add(pattern_id)
+
+            self._db.scan(code.encode(), match_event_handler=_on_match)
+            return found
+        return {int(m.lastgroup[1:]) for m in self._combined.finditer(code)}
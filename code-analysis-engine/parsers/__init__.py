@@ -0,0 +1,44 @@
+from .base_parser import BaseParser
+from .cirq_parser import CirqParser
+from .openqasm_parser import OpenQASMParser
+from .python_parser import PythonParser
+from .qiskit_parser import QiskitParser
+from .qsharp_parser import QSharpParser
+
+# Module-level parser registry: regexes and gate mappings live on the
+# classes, and the parsers themselves hold no per-parse state, so one
+# shared instance per language serves every caller (and every thread).
+# Instances are created lazily - most deployments only ever see one or
+# two languages. SupportedLanguage is a str enum, so both enum members
+# and their string values work as keys.
+_PARSER_CLASSES = {
+    "python": PythonParser,
+    "qiskit": QiskitParser,
+    "cirq": CirqParser,
+    "qsharp": QSharpParser,
+    "openqasm": OpenQASMParser,
+}
+_parsers = {}
+
+
+def get_parser(language) -> BaseParser:
+    """Return the shared parser instance for ``language``."""
+    parser = _parsers.get(language)
+    if parser is None:
+        cls = _PARSER_CLASSES.get(language)
+        if cls is None:
+            raise ValueError(f"Unsupported language: {language}")
+        parser = cls()
+        _parsers[language] = parser
+    return parser
+
+
+__all__ = [
+    "BaseParser",
+    "CirqParser",
+    "OpenQASMParser",
+    "PythonParser",
+    "QiskitParser",
+    "QSharpParser",
+    "get_parser",
+]
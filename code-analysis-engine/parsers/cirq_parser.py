@@ -0,0 +1,127 @@
+"""Parser for Cirq (Python) source code."""
+
+import re
+from types import MappingProxyType
+from typing import Any, Dict, List
+
+from models.unified_ast import (
+    GateType,
+    MeasurementNode,
+    QuantumGateNode,
+    QuantumRegisterNode,
+)
+from .base_parser import BaseParser, _Source
+
+# Built once at import; the class exposes a read-only view so nothing can
+# mutate shared parser state.
+_GATE_MAPPING = {
+    "h": GateType.H,
+    "x": GateType.X,
+    "y": GateType.Y,
+    "z": GateType.Z,
+    "s": GateType.S,
+    "t": GateType.T,
+    "rx": GateType.RX,
+    "ry": GateType.RY,
+    "rz": GateType.RZ,
+    "cnot": GateType.CNOT,
+    "cx": GateType.CX,
+    "cz": GateType.CZ,
+    "swap": GateType.SWAP,
+    "ccx": GateType.CCX,
+    "toffoli": GateType.TOFFOLI,
+}
+
+
+class CirqParser(BaseParser):
+    # Mapping and regexes are class attributes compiled once at import
+    # time; instances carry no per-parse state (see parsers.get_parser).
+    gate_mapping = MappingProxyType(_GATE_MAPPING)
+    _line_qubit_re = re.compile(r"cirq\.LineQubit\.range\s*\(\s*(\d+)\s*\)")
+    _grid_qubit_re = re.compile(r"cirq\.GridQubit\.rect\s*\(\s*(\d+)\s*,\s*(\d+)")
+    _gate_re = re.compile(r"cirq\.(\w+)\s*(?:\*\*[\d.]+\s*)?\(")
+    _measure_re = re.compile(r"cirq\.measure\s*\(")
+    _qubit_index_re = re.compile(r"q\[?(\d+)\]?")
+
+    def _parse(self, src: _Source) -> Dict[str, Any]:
+        return {
+            "imports": self.extract_imports(src),
+            "quantum_registers": self.extract_registers(src),
+            "classical_registers": [],
+            "gates": self.extract_quantum_operations(src),
+            "measurements": self.extract_measurements(src),
+            "functions": self.extract_functions(src.code),
+        }
+
+    def extract_imports(self, src: _Source) -> List[str]:
+        # An import line always starts with 'import ' or 'from '; the
+        # startswith test skips the substring scan on everything else.
+        imports = []
+        for line in src.lines:
+            stripped = line.strip()
+            if stripped.startswith(("from ", "import ")) and "cirq" in stripped:
+                imports.append(stripped)
+        return imports
+
+    def extract_registers(self, src: _Source) -> List[QuantumRegisterNode]:
+        if "Qubit" not in src.code:
+            return []
+        registers = []
+        for match in self._line_qubit_re.finditer(src.code):
+            registers.append(
+                QuantumRegisterNode(
+                    name="q",
+                    size=int(match.group(1)),
+                    line_number=src.line_of(match.start()),
+                )
+            )
+        for match in self._grid_qubit_re.finditer(src.code):
+            registers.append(
+                QuantumRegisterNode(
+                    name="grid",
+                    size=int(match.group(1)) * int(match.group(2)),
+                    line_number=src.line_of(match.start()),
+                )
+            )
+        return registers
+
+    def extract_quantum_operations(self, src: _Source) -> List[QuantumGateNode]:
+        code = src.code
+        # One C-level substring test elides the whole regex sweep on
+        # sources that cannot contain a cirq gate call.
+        if "cirq." not in code:
+            return []
+        gates = []
+        for match in self._gate_re.finditer(code):
+            gate_name = match.group(1).lower()
+            if gate_name in self.gate_mapping:
+                gate_type = self.gate_mapping[gate_name]
+                # Qubit operands sit between the opening paren and the end
+                # of the statement's line.
+                eol = code.find("\n", match.end())
+                if eol == -1:
+                    eol = len(code)
+                qubits = [
+                    int(n)
+                    for n in self._qubit_index_re.findall(code, match.end(), eol)
+                ]
+                gates.append(
+                    QuantumGateNode(
+                        gate_type=gate_type,
+                        qubits=qubits,
+                        is_controlled=gate_type
+                        in {GateType.CNOT, GateType.CX, GateType.CZ, GateType.CCX, GateType.TOFFOLI},
+                        line_number=src.line_of(match.start()),
+                    )
+                )
+        return gates
+
+    def extract_measurements(self, src: _Source) -> List[MeasurementNode]:
+        if "cirq.measure" not in src.code:
+            return []
+        measurements = []
+        for match in self._measure_re.finditer(src.code):
+            measurements.append(
+                MeasurementNode(line_number=src.line_of(match.start()))
+            )
+        return measurements
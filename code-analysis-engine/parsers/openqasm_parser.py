@@ -0,0 +1,135 @@
+"""Parser for OpenQASM 2.0 source code."""
+
+import re
+from types import MappingProxyType
+from typing import Any, Dict, List
+
+from models.unified_ast import (
+    ClassicalRegisterNode,
+    GateType,
+    MeasurementNode,
+    QuantumGateNode,
+    QuantumRegisterNode,
+)
+from .base_parser import BaseParser, _Source
+
+# One C-level scan per operand list instead of split/find/int token
+# handling. Only bracketed indices count, so registers whose names carry
+# digits (q2) do not pollute the result.
+_BRACKET_INT_RE = re.compile(r"\[(\d+)\]")
+
+# Built once at import; the class exposes a read-only view so nothing can
+# mutate shared parser state.
+_GATE_MAPPING = {
+    "h": GateType.H,
+    "x": GateType.X,
+    "y": GateType.Y,
+    "z": GateType.Z,
+    "s": GateType.S,
+    "t": GateType.T,
+    "rx": GateType.RX,
+    "ry": GateType.RY,
+    "rz": GateType.RZ,
+    "cx": GateType.CX,
+    "cnot": GateType.CNOT,
+    "cz": GateType.CZ,
+    "swap": GateType.SWAP,
+    "ccx": GateType.CCX,
+    "reset": GateType.RESET,
+    "barrier": GateType.BARRIER,
+}
+
+
+class OpenQASMParser(BaseParser):
+    # Mapping and regexes are class attributes compiled once at import
+    # time; instances carry no per-parse state (see parsers.get_parser).
+    gate_mapping = MappingProxyType(_GATE_MAPPING)
+    _qreg_re = re.compile(r"^\s*qreg\s+(\w+)\s*\[\s*(\d+)\s*\]", re.MULTILINE)
+    _creg_re = re.compile(r"^\s*creg\s+(\w+)\s*\[\s*(\d+)\s*\]", re.MULTILINE)
+    # Known gate names are baked into the alternation: the regex engine
+    # rejects non-gate statements itself and no per-match .lower() or
+    # skip-set check is needed for lowercase QASM.
+    _gate_re = re.compile(
+        r"^\s*({})(?:\s*\([^)]*\))?\s+([^;\n]+);".format(
+            "|".join(sorted(gate_mapping, key=len, reverse=True))
+        ),
+        re.MULTILINE | re.IGNORECASE,
+    )
+    _measure_re = re.compile(
+        r"measure\s+(\w+(?:\[\d+\])?)\s*->\s*(\w+(?:\[\d+\])?)"
+    )
+    _include_re = re.compile(r'^.*include\s+"[\w.]+".*$', re.MULTILINE)
+
+    def _parse(self, src: _Source) -> Dict[str, Any]:
+        registers = self.extract_registers(src)
+        return {
+            "imports": self.extract_imports(src),
+            "quantum_registers": registers[0],
+            "classical_registers": registers[1],
+            "gates": self.extract_quantum_operations(src),
+            "measurements": self.extract_measurements(src),
+            "functions": [],
+        }
+
+    def extract_imports(self, src: _Source) -> List[str]:
+        # One compiled MULTILINE sweep over the whole source; '.' stops at
+        # newlines, so each match is exactly the include's line.
+        return [
+            match.group(0).strip().strip(";")
+            for match in self._include_re.finditer(src.code)
+        ]
+
+    def extract_registers(self, src: _Source):
+        quantum_registers = [
+            QuantumRegisterNode(
+                name=match.group(1),
+                size=int(match.group(2)),
+                line_number=src.line_of(match.start()),
+            )
+            for match in self._qreg_re.finditer(src.code)
+        ]
+        classical_registers = [
+            ClassicalRegisterNode(
+                name=match.group(1),
+                size=int(match.group(2)),
+                line_number=src.line_of(match.start()),
+            )
+            for match in self._creg_re.finditer(src.code)
+        ]
+        return quantum_registers, classical_registers
+
+    def extract_quantum_operations(self, src: _Source) -> List[QuantumGateNode]:
+        gates = []
+        for match in self._gate_re.finditer(src.code):
+            gate_name = match.group(1)
+            gate_type = self.gate_mapping.get(gate_name)
+            if gate_type is None:
+                # IGNORECASE matched an uppercase spelling; lower once here.
+                gate_type = self.gate_mapping[gate_name.lower()]
+            qubits = self._extract_qubit_indices(match.group(2))
+            gates.append(
+                QuantumGateNode(
+                    gate_type=gate_type,
+                    qubits=qubits,
+                    is_controlled=gate_type
+                    in {GateType.CX, GateType.CNOT, GateType.CZ, GateType.CCX},
+                    line_number=src.line_of(match.start()),
+                )
+            )
+        return gates
+
+    def extract_measurements(self, src: _Source) -> List[MeasurementNode]:
+        measurements = []
+        for match in self._measure_re.finditer(src.code):
+            measurements.append(
+                MeasurementNode(
+                    qubits=self._extract_qubit_indices(match.group(1)),
+                    classical_bits=self._extract_qubit_indices(match.group(2)),
+                    line_number=src.line_of(match.start()),
+                )
+            )
+        return measurements
+
+    @staticmethod
+    def _extract_qubit_indices(args: str) -> List[int]:
+        return [int(s) for s in _BRACKET_INT_RE.findall(args)]
@@ -0,0 +1,27 @@
+"""Parser for plain (non-quantum) Python source code."""
+
+from typing import Any, Dict, List
+
+from .base_parser import BaseParser, _Source
+
+
+class PythonParser(BaseParser):
+    def _parse(self, src: _Source) -> Dict[str, Any]:
+        return {
+            "imports": self.extract_imports(src),
+            "quantum_registers": [],
+            "classical_registers": [],
+            "gates": [],
+            "measurements": [],
+            "functions": self.extract_functions(src.code),
+        }
+
+    def extract_imports(self, src: _Source) -> List[str]:
+        # startswith on the lstripped line fast-rejects the overwhelming
+        # majority of lines without invoking the regex machinery.
+        imports = []
+        for line in src.lines:
+            stripped = line.lstrip()
+            if stripped.startswith(("import ", "from ")):
+                imports.append(stripped.rstrip())
+        return imports
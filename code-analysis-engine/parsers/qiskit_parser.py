@@ -0,0 +1,297 @@
+"""Parser for Qiskit (Python) source code."""
+
+import ast
+import re
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional
+
+from models.unified_ast import (
+    ClassicalRegisterNode,
+    GateType,
+    MeasurementNode,
+    QuantumGateNode,
+    QuantumRegisterNode,
+)
+from .base_parser import BaseParser, _Source
+
+# One C-level digit scan per argument list instead of split/strip/int
+# over hand-cleaned tokens.
+_INT_RE = re.compile(r"\d+")
+
+# Built once at import; the class exposes a read-only view so nothing can
+# mutate shared parser state.
+_GATE_MAPPING = {
+    "h": GateType.H,
+    "x": GateType.X,
+    "y": GateType.Y,
+    "z": GateType.Z,
+    "s": GateType.S,
+    "t": GateType.T,
+    "rx": GateType.RX,
+    "ry": GateType.RY,
+    "rz": GateType.RZ,
+    "cx": GateType.CX,
+    "cnot": GateType.CNOT,
+    "cz": GateType.CZ,
+    "swap": GateType.SWAP,
+    "ccx": GateType.CCX,
+    "toffoli": GateType.TOFFOLI,
+    "reset": GateType.RESET,
+    "barrier": GateType.BARRIER,
+}
+
+
+class _QiskitVisitor(ast.NodeVisitor):
+    """Fills imports, registers, gates, measurements and functions in one
+    walk of an already-parsed tree, replacing four per-line regex sweeps."""
+
+    _CONTROLLED = {GateType.CX, GateType.CNOT, GateType.CZ, GateType.CCX, GateType.TOFFOLI}
+
+    def __init__(self, gate_mapping: Dict[str, GateType], lines: List[str]):
+        self._gate_mapping = gate_mapping
+        self._lines = lines
+        self._assign_target: Optional[str] = None
+        self.imports: List[str] = []
+        self.quantum_registers: List[QuantumRegisterNode] = []
+        self.classical_registers: List[ClassicalRegisterNode] = []
+        self.gates: List[QuantumGateNode] = []
+        self.measurements: List[MeasurementNode] = []
+        self.functions: List[Dict[str, Any]] = []
+
+    def _source_line(self, node: ast.AST) -> str:
+        return self._lines[node.lineno - 1].strip()
+
+    def visit_Import(self, node: ast.Import) -> None:
+        if any(alias.name.split(".")[0] == "qiskit" for alias in node.names):
+            self.imports.append(self._source_line(node))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module and node.module.split(".")[0] == "qiskit":
+            self.imports.append(self._source_line(node))
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.functions.append(
+            {
+                "name": node.name,
+                "line": node.lineno,
+                "args": [arg.arg for arg in node.args.args],
+            }
+        )
+        self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        # Remember the bound name so register constructors pick it up.
+        if len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            self._assign_target = node.targets[0].id
+        self.generic_visit(node)
+        self._assign_target = None
+
+    @staticmethod
+    def _int_args(node: ast.Call) -> List[int]:
+        indices = []
+        for arg in node.args:
+            for sub in ast.walk(arg):
+                if isinstance(sub, ast.Constant) and isinstance(sub.value, int):
+                    indices.append(sub.value)
+        return indices
+
+    def visit_Call(self, node: ast.Call) -> None:
+        func = node.func
+        if isinstance(func, ast.Name):
+            sizes = self._int_args(node)
+            if func.id == "QuantumRegister" and sizes:
+                self.quantum_registers.append(
+                    QuantumRegisterNode(
+                        name=self._assign_target or "q",
+                        size=sizes[0],
+                        line_number=node.lineno,
+                    )
+                )
+            elif func.id == "ClassicalRegister" and sizes:
+                self.classical_registers.append(
+                    ClassicalRegisterNode(
+                        name=self._assign_target or "c",
+                        size=sizes[0],
+                        line_number=node.lineno,
+                    )
+                )
+            elif func.id == "QuantumCircuit" and sizes:
+                self.quantum_registers.append(
+                    QuantumRegisterNode(
+                        name="q", size=sizes[0], line_number=node.lineno
+                    )
+                )
+                if len(sizes) > 1:
+                    self.classical_registers.append(
+                        ClassicalRegisterNode(
+                            name="c", size=sizes[1], line_number=node.lineno
+                        )
+                    )
+        elif isinstance(func, ast.Attribute):
+            name = func.attr
+            if name == "measure" or name == "measure_all":
+                indices = self._int_args(node)
+                half = max(len(indices) // 2, 1)
+                self.measurements.append(
+                    MeasurementNode(
+                        qubits=indices[:half],
+                        classical_bits=indices[half:],
+                        line_number=node.lineno,
+                    )
+                )
+            else:
+                gate_type = self._gate_mapping.get(name)
+                if gate_type is None and not name.islower():
+                    gate_type = self._gate_mapping.get(name.lower())
+                if gate_type is not None:
+                    self.gates.append(
+                        QuantumGateNode(
+                            gate_type=gate_type,
+                            qubits=self._int_args(node),
+                            is_controlled=gate_type in self._CONTROLLED,
+                            line_number=node.lineno,
+                        )
+                    )
+        self.generic_visit(node)
+
+
+class QiskitParser(BaseParser):
+    # Mapping and regexes are class attributes compiled once at import
+    # time; instances carry no per-parse state (see parsers.get_parser).
+    gate_mapping = MappingProxyType(_GATE_MAPPING)
+    _qreg_re = re.compile(r"(\w+)\s*=\s*QuantumRegister\s*\(\s*(\d+)")
+    _creg_re = re.compile(r"(\w+)\s*=\s*ClassicalRegister\s*\(\s*(\d+)")
+    _circuit_re = re.compile(r"QuantumCircuit\s*\(\s*(\d+)(?:\s*,\s*(\d+))?")
+    # The valid gate names are baked into the alternation so the regex
+    # engine's prefilter rejects non-gate method calls (.draw, .compose)
+    # before Python sees them, and no per-match .lower() is needed on
+    # the conventional lowercase spelling.
+    _gate_re = re.compile(
+        r"\.({})\s*\(\s*([\d,\s]*)\s*\)".format(
+            "|".join(sorted(gate_mapping, key=len, reverse=True))
+        ),
+        re.IGNORECASE,
+    )
+    _measure_re = re.compile(r"\.measure(_all)?\s*\(\s*([^)]*)\s*\)")
+
+    def _parse(self, src: _Source) -> Dict[str, Any]:
+        # Qiskit source is Python: one ast.parse plus one visitor walk
+        # replaces the regex sweeps. The regex extractors below remain as
+        # the fallback for snippets that do not parse.
+        try:
+            tree = ast.parse(src.code)
+        except SyntaxError:
+            return self._parse_regex(src)
+        visitor = _QiskitVisitor(self.gate_mapping, src.lines)
+        visitor.visit(tree)
+        return {
+            "imports": visitor.imports,
+            "quantum_registers": visitor.quantum_registers,
+            "classical_registers": visitor.classical_registers,
+            "gates": visitor.gates,
+            "measurements": visitor.measurements,
+            "functions": visitor.functions,
+        }
+
+    def _parse_regex(self, src: _Source) -> Dict[str, Any]:
+        quantum_registers, classical_registers = self.extract_registers(src)
+        return {
+            "imports": self.extract_imports(src),
+            "quantum_registers": quantum_registers,
+            "classical_registers": classical_registers,
+            "gates": self.extract_quantum_operations(src),
+            "measurements": self.extract_measurements(src),
+            "functions": self.extract_functions(src.code),
+        }
+
+    def extract_imports(self, src: _Source) -> List[str]:
+        # An import line always starts with 'import ' or 'from '; two
+        # startswith/substring tests replace three regex searches per line.
+        imports = []
+        for line in src.lines:
+            stripped = line.strip()
+            if stripped.startswith(("from ", "import ")) and "qiskit" in stripped:
+                imports.append(stripped)
+        return imports
+
+    def extract_registers(self, src: _Source):
+        quantum_registers = []
+        classical_registers = []
+        for match in self._qreg_re.finditer(src.code):
+            quantum_registers.append(
+                QuantumRegisterNode(
+                    name=match.group(1),
+                    size=int(match.group(2)),
+                    line_number=src.line_of(match.start()),
+                )
+            )
+        for match in self._creg_re.finditer(src.code):
+            classical_registers.append(
+                ClassicalRegisterNode(
+                    name=match.group(1),
+                    size=int(match.group(2)),
+                    line_number=src.line_of(match.start()),
+                )
+            )
+        for match in self._circuit_re.finditer(src.code):
+            lineno = src.line_of(match.start())
+            quantum_registers.append(
+                QuantumRegisterNode(
+                    name="q", size=int(match.group(1)), line_number=lineno
+                )
+            )
+            if match.group(2):
+                classical_registers.append(
+                    ClassicalRegisterNode(
+                        name="c", size=int(match.group(2)), line_number=lineno
+                    )
+                )
+        return quantum_registers, classical_registers
+
+    def extract_quantum_operations(self, src: _Source) -> List[QuantumGateNode]:
+        code = src.code
+        # A gate application is always a method call; without both tokens
+        # the regex sweep cannot match anything.
+        if "." not in code or "(" not in code:
+            return []
+        gates = []
+        for match in self._gate_re.finditer(code):
+            gate_name = match.group(1)
+            gate_type = self.gate_mapping.get(gate_name)
+            if gate_type is None:
+                # IGNORECASE matched an unusual spelling; lower once here.
+                gate_type = self.gate_mapping[gate_name.lower()]
+            qubits = self._parse_indices(match.group(2))
+            gates.append(
+                QuantumGateNode(
+                    gate_type=gate_type,
+                    qubits=qubits,
+                    is_controlled=gate_type
+                    in {GateType.CX, GateType.CNOT, GateType.CZ, GateType.CCX, GateType.TOFFOLI},
+                    line_number=src.line_of(match.start()),
+                )
+            )
+        return gates
+
+    def extract_measurements(self, src: _Source) -> List[MeasurementNode]:
+        measurements = []
+        for match in self._measure_re.finditer(src.code):
+            lineno = src.line_of(match.start())
+            if match.group(1):
+                measurements.append(MeasurementNode(line_number=lineno))
+                continue
+            indices = self._parse_indices(match.group(2))
+            measurements.append(
+                MeasurementNode(
+                    qubits=indices[: max(len(indices) // 2, 1)],
+                    classical_bits=indices[max(len(indices) // 2, 1):],
+                    line_number=lineno,
+                )
+            )
+        return measurements
+
+    @staticmethod
+    def _parse_indices(args: str) -> List[int]:
+        return [int(s) for s in _INT_RE.findall(args)]
@@ -0,0 +1,61 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional Cython fast path for the analyzer's ASAP depth loop.
+
+Build in place with ``python setup_ext.py build_ext --inplace``; the
+analyzer falls back to the pure-Python dict loop when the extension is
+not built. Must stay semantically aligned with
+QuantumAnalyzer._depth_of in modules/quantum_analyzer.py: each gate
+lands one layer above the deepest layer occupied on any of its wires,
+and gates with no recorded qubits are ignored.
+"""
+
+from libc.stdlib cimport calloc, free
+
+# Qubit indices beyond this are treated as implausible and routed to the
+# dict-based fallback, which handles sparse indices without a dense table.
+DEF MAX_QUBIT_INDEX = 1048576
+
+
+cpdef int depth_of(tuple qubit_groups):
+    """ASAP depth over per-gate qubit tuples.
+
+    Returns -1 when an index is negative, implausibly large, or the
+    layer table cannot be allocated; the caller falls back to Python.
+    """
+    cdef Py_ssize_t i, j, m, n = len(qubit_groups)
+    cdef long q, maxq = -1
+    cdef tuple qubits
+    for i in range(n):
+        qubits = <tuple> qubit_groups[i]
+        for j in range(len(qubits)):
+            q = qubits[j]
+            if q < 0 or q > MAX_QUBIT_INDEX:
+                return -1
+            if q > maxq:
+                maxq = q
+    if maxq < 0:
+        return 0
+    cdef int* layers = <int*> calloc(maxq + 1, sizeof(int))
+    if layers is NULL:
+        return -1
+    cdef int layer, depth = 0
+    try:
+        for i in range(n):
+            qubits = <tuple> qubit_groups[i]
+            m = len(qubits)
+            if m == 0:
+                continue
+            layer = 0
+            for j in range(m):
+                q = qubits[j]
+                if layers[q] > layer:
+                    layer = layers[q]
+            layer += 1
+            for j in range(m):
+                q = qubits[j]
+                layers[q] = layer
+            if layer > depth:
+                depth = layer
+    finally:
+        free(layers)
+    return depth
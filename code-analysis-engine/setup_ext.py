@@ -0,0 +1,20 @@
+"""Builds the optional Cython extensions.
+
+Usage:
+    pip install cython
+    python setup_ext.py build_ext --inplace
+
+The engine runs fine without them; the analyzers import the compiled
+modules when present and fall back to pure Python otherwise.
+"""
+
+from setuptools import setup
+
+from Cython.Build import cythonize
+
+setup(
+    name="code-analysis-engine-ext",
+    ext_modules=cythonize(
+        ["complexity_core.pyx", "quantum_analyzer_core.pyx"], language_level=3
+    ),
+)
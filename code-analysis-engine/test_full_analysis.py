@@ -0,0 +1,161 @@
+"""End-to-end tests for the analysis pipeline."""
+
+from fastapi.testclient import TestClient
+
+import main
+from main import app
+from models.unified_ast import SupportedLanguage
+
+client = TestClient(app)
+
+QISKIT_BELL = """
+from qiskit import QuantumCircuit
+qc = QuantumCircuit(2, 2)
+qc.h(0)
+qc.cx(0, 1)
+qc.measure(0, 0)
+qc.measure(1, 1)
+"""
+
+OPENQASM_BELL = """
+OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+creg c[2];
+h q[0];
+cx q[0],q[1];
+measure q[0] -> c[0];
+measure q[1] -> c[1];
+"""
+
+QSHARP_SAMPLE = """
+namespace Demo {
+    open Microsoft.Quantum.Intrinsic;
+    operation Bell() : Unit {
+        use q = Qubit[2];
+        H(q[0]);
+        CNOT(q[0], q[1]);
+    }
+}
+"""
+
+LARGE_QASM = """
+OPENQASM 2.0;
+qreg q[1100];
+h q[0];
+"""
+
+CLASSICAL_PYTHON = """
+def bubble_sort(items):
+    for i in range(len(items)):
+        for j in range(len(items) - 1):
+            if items[j] > items[j + 1]:
+                items[j], items[j + 1] = items[j + 1], items[j]
+    return items
+"""
+
+
+def test_detect_qiskit():
+    response = client.post("/detect-language", json={"code": QISKIT_BELL})
+    assert response.status_code == 200
+    assert response.json()["language"] == "qiskit"
+
+
+def test_detect_openqasm():
+    response = client.post("/detect-language", json={"code": OPENQASM_BELL})
+    assert response.status_code == 200
+    assert response.json()["language"] == "openqasm"
+
+
+def test_detect_qsharp():
+    response = client.post("/detect-language", json={"code": QSHARP_SAMPLE})
+    assert response.status_code == 200
+    assert response.json()["language"] == "qsharp"
+
+
+def test_analyze_qiskit_bell():
+    response = client.post("/analyze", json={"code": QISKIT_BELL})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["language"] == "qiskit"
+    assert body["gate_count"] >= 2
+    assert body["qubits_required"] == 2
+    quantum = body["quantum_complexity"]
+    assert quantum["has_superposition"] is True
+    assert quantum["has_entanglement"] is True
+
+
+def test_analyze_openqasm_bell():
+    response = client.post("/analyze", json={"code": OPENQASM_BELL})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["qubits_required"] == 2
+    assert body["quantum_complexity"]["measurement_count"] == 2
+
+
+def test_analyze_large_register_does_not_overflow():
+    # qreg q[1100]; is valid OpenQASM and must not 500 on the memory or
+    # volume estimates (float pow overflows near 2**1024 uncapped).
+    response = client.post("/analyze", json={"code": LARGE_QASM})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["qubits_required"] == 1100
+    assert body["quantum_complexity"]["memory_requirement_mb"] > 0
+
+
+def test_python_classical():
+    response = client.post("/analyze", json={"code": CLASSICAL_PYTHON})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["language"] == "python"
+    assert body["classification"] == "classical"
+    assert body["gate_count"] == 0
+    assert body["classical_complexity"]["loop_count"] == 2
+
+
+def test_analyze_cache_hit_is_consistent():
+    first = client.post("/analyze", json={"code": QISKIT_BELL})
+    second = client.post("/analyze", json={"code": QISKIT_BELL})
+    assert first.json() == second.json()
+    assert main._cache_key(QISKIT_BELL) in main._result_cache
+
+
+def test_analyze_batch():
+    response = client.post(
+        "/analyze-batch",
+        json=[{"code": QISKIT_BELL}, {"code": CLASSICAL_PYTHON}],
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body) == 2
+    assert body[0]["language"] == "qiskit"
+    assert body[1]["classification"] == "classical"
+
+
+def test_analyze_batch_item_error_does_not_break_pool():
+    response = client.post(
+        "/analyze-batch",
+        json=[{"code": QISKIT_BELL}, {"code": "!!! not code @@@"}],
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body[0]["language"] == "qiskit"
+    assert body[1] == {"detail": "Could not detect language", "status_code": 400}
+    # The failing item must not poison the shared worker pool: a fresh
+    # (uncached) submission still analyzes on the next batch.
+    followup = client.post(
+        "/analyze-batch",
+        json=[{"code": OPENQASM_BELL.replace("q[2]", "q[3]")}],
+    )
+    assert followup.status_code == 200
+    assert followup.json()[0]["language"] == "openqasm"
+
+
+def test_empty_submission_rejected():
+    response = client.post("/analyze", json={"code": "   "})
+    assert response.status_code == 400
+
+
+def test_unknown_language_rejected():
+    response = client.post("/analyze", json={"code": "!!! not code @@@"})
+    assert response.status_code == 400